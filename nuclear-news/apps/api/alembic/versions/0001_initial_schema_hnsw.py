@@ -0,0 +1,91 @@
+"""Initial schema + HNSW index on raw_articles.embedding
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-08-30
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from pgvector.sqlalchemy import Vector
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+
+    op.create_table(
+        "sources",
+        sa.Column("id", UUID(as_uuid=True), primary_key=True),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("slug", sa.String(100), unique=True, nullable=False),
+        sa.Column("url", sa.String(500), nullable=False),
+        sa.Column("adapter_type", sa.String(50), nullable=False),
+        sa.Column("adapter_config", JSONB),
+        sa.Column("is_active", sa.Boolean),
+        sa.Column("scrape_interval_minutes", sa.Integer),
+        sa.Column("last_scraped_at", sa.DateTime),
+        sa.Column("created_at", sa.DateTime),
+    )
+
+    op.create_table(
+        "raw_articles",
+        sa.Column("id", UUID(as_uuid=True), primary_key=True),
+        sa.Column("source_id", UUID(as_uuid=True), sa.ForeignKey("sources.id"), nullable=False),
+        sa.Column("external_id", sa.String(500)),
+        sa.Column("external_url", sa.String(1000), nullable=False),
+        sa.Column("title_original", sa.Text, nullable=False),
+        sa.Column("content_original", sa.Text),
+        sa.Column("published_at", sa.DateTime),
+        sa.Column("scraped_at", sa.DateTime),
+        sa.Column("processing_status", sa.String(50)),
+        sa.Column("embedding", Vector(1536)),
+        sa.Column("metadata", JSONB),
+    )
+
+    op.create_table(
+        "articles",
+        sa.Column("id", UUID(as_uuid=True), primary_key=True),
+        sa.Column("slug", sa.String(500), unique=True, nullable=False),
+        sa.Column("title", sa.String(500), nullable=False),
+        sa.Column("excerpt", sa.Text, nullable=False),
+        sa.Column("content", sa.Text, nullable=False),
+        sa.Column("category", sa.String(100), nullable=False),
+        sa.Column("tags", sa.ARRAY(sa.Text)),
+        sa.Column("significance_score", sa.Integer),
+        sa.Column("cover_image_url", sa.String(1000)),
+        sa.Column("source_ids", sa.ARRAY(UUID(as_uuid=True)), nullable=False),
+        sa.Column("original_urls", sa.ARRAY(sa.Text), nullable=False),
+        sa.Column("status", sa.String(50)),
+        sa.Column("published_at", sa.DateTime),
+        sa.Column("ai_model", sa.String(100)),
+        sa.Column("ai_prompt_version", sa.String(50)),
+        sa.Column("processing_cost_usd", sa.Numeric(10, 6)),
+        sa.Column("created_at", sa.DateTime),
+        sa.Column("updated_at", sa.DateTime),
+        sa.Column("created_by", UUID(as_uuid=True)),
+        sa.Column("published_by", UUID(as_uuid=True)),
+    )
+
+    # HNSW index so dedup similarity search is O(log N) instead of a
+    # sequential scan over every stored embedding. ef_search is applied
+    # per connection by the app (hnsw.ef_search server setting).
+    op.create_index(
+        "idx_raw_articles_embedding_hnsw",
+        "raw_articles",
+        ["embedding"],
+        postgresql_using="hnsw",
+        postgresql_with={"m": 24, "ef_construction": 128},
+        postgresql_ops={"embedding": "vector_cosine_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_raw_articles_embedding_hnsw", table_name="raw_articles")
+    op.drop_table("articles")
+    op.drop_table("raw_articles")
+    op.drop_table("sources")
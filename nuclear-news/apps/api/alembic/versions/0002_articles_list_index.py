@@ -0,0 +1,25 @@
+"""Composite index for the articles list endpoint
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-08-30
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_articles_status_category_created",
+        "articles",
+        ["status", "category", sa.text("created_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_articles_status_category_created", table_name="articles")
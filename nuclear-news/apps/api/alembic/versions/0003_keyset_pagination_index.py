@@ -0,0 +1,25 @@
+"""Keyset pagination index on articles (created_at, id)
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-08-30
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_articles_created_id",
+        "articles",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_articles_created_id", table_name="articles")
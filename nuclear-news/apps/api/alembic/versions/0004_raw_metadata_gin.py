@@ -0,0 +1,25 @@
+"""GIN index on raw_articles.metadata
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-08-30
+"""
+from alembic import op
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_raw_articles_meta_gin",
+        "raw_articles",
+        ["metadata"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_raw_articles_meta_gin", table_name="raw_articles")
@@ -0,0 +1,49 @@
+"""Partial and covering indexes for hot filters
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-08-30
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_articles_draft",
+        "articles",
+        [sa.text("created_at DESC")],
+        postgresql_where=sa.text("status = 'draft'"),
+        postgresql_include=["slug", "title", "category"],
+    )
+    op.create_index(
+        "idx_articles_published",
+        "articles",
+        [sa.text("published_at DESC")],
+        postgresql_where=sa.text("status = 'published'"),
+        postgresql_include=["slug", "title", "category"],
+    )
+    op.create_index(
+        "idx_sources_active",
+        "sources",
+        ["name"],
+        postgresql_where=sa.text("is_active IS true"),
+    )
+    op.create_index(
+        "idx_raw_pending",
+        "raw_articles",
+        ["scraped_at"],
+        postgresql_where=sa.text("processing_status IN ('pending', 'processing')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_raw_pending", table_name="raw_articles")
+    op.drop_index("idx_sources_active", table_name="sources")
+    op.drop_index("idx_articles_published", table_name="articles")
+    op.drop_index("idx_articles_draft", table_name="articles")
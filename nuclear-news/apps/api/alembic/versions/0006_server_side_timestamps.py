@@ -0,0 +1,26 @@
+"""Move timestamp defaults to the database
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-08-30
+"""
+from alembic import op
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE sources ALTER COLUMN created_at SET DEFAULT now()")
+    op.execute("ALTER TABLE raw_articles ALTER COLUMN scraped_at SET DEFAULT now()")
+    op.execute("ALTER TABLE articles ALTER COLUMN created_at SET DEFAULT now()")
+    op.execute("ALTER TABLE articles ALTER COLUMN updated_at SET DEFAULT now()")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE articles ALTER COLUMN updated_at DROP DEFAULT")
+    op.execute("ALTER TABLE articles ALTER COLUMN created_at DROP DEFAULT")
+    op.execute("ALTER TABLE raw_articles ALTER COLUMN scraped_at DROP DEFAULT")
+    op.execute("ALTER TABLE sources ALTER COLUMN created_at DROP DEFAULT")
@@ -0,0 +1,22 @@
+"""Unique (source_id, external_id) on raw_articles
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-08-30
+"""
+from alembic import op
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_unique_constraint(
+        "uq_raw_source_ext", "raw_articles", ["source_id", "external_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_raw_source_ext", "raw_articles", type_="unique")
@@ -0,0 +1,54 @@
+"""Optional StreamingDiskANN index for raw_articles.embedding
+
+Gated on VECTOR_INDEX=diskann; a no-op in the default HNSW setup.
+
+DiskANN (pgvectorscale) streams the graph from SSD instead of holding
+it in RAM, which keeps similarity search fast once the embedding table
+grows past a few million rows - at the cost of a longer initial build
+and an extra extension to operate. Query code is unchanged either way:
+both indexes serve the same <=> cosine-distance operator.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-08-30
+"""
+from alembic import op
+
+from app.config import settings
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if settings.VECTOR_INDEX != "diskann":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS vectorscale CASCADE")
+    op.drop_index("idx_raw_articles_embedding_hnsw", table_name="raw_articles")
+    op.execute(
+        """
+        CREATE INDEX idx_raw_articles_embedding_diskann
+        ON raw_articles USING diskann (embedding vector_cosine_ops)
+        WITH (storage_layout = memory_optimized,
+              num_neighbors = 50,
+              search_list_size = 100)
+        """
+    )
+
+
+def downgrade() -> None:
+    if settings.VECTOR_INDEX != "diskann":
+        return
+
+    op.drop_index("idx_raw_articles_embedding_diskann", table_name="raw_articles")
+    op.create_index(
+        "idx_raw_articles_embedding_hnsw",
+        "raw_articles",
+        ["embedding"],
+        postgresql_using="hnsw",
+        postgresql_with={"m": 24, "ef_construction": 128},
+        postgresql_ops={"embedding": "vector_cosine_ops"},
+    )
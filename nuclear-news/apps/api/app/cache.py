@@ -0,0 +1,40 @@
+"""
+Shared async Redis client for response caching
+"""
+from typing import Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.config import settings
+
+# decode_responses=False - cached values are pre-serialized JSON bytes
+# that go straight into Response bodies
+redis = Redis.from_url(settings.REDIS_URL, decode_responses=False)
+
+
+# The cache is an optimization, never a dependency: a Redis outage must
+# degrade to the database, not 500 endpoints that worked without Redis.
+
+async def cache_get(key: str) -> Optional[bytes]:
+    """Fetch a cached payload; Redis errors read as a miss"""
+    try:
+        return await redis.get(key)
+    except RedisError:
+        return None
+
+
+async def cache_set(key: str, value: "bytes | str", ttl: int) -> None:
+    """Store a payload with a TTL; Redis errors are swallowed"""
+    try:
+        await redis.set(key, value, ex=ttl)
+    except RedisError:
+        pass
+
+
+async def cache_delete(*keys: str) -> None:
+    """Invalidate keys; Redis errors are swallowed (TTL still bounds staleness)"""
+    try:
+        await redis.delete(*keys)
+    except RedisError:
+        pass
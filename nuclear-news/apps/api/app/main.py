@@ -2,20 +2,41 @@
 нуклеар.ру API
 FastAPI backend for nuclear medicine news aggregation platform
 """
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
+try:
+    from brotli_asgi import BrotliMiddleware
+except ImportError:  # pragma: no cover - brotli wheel not available
+    BrotliMiddleware = None
+from sqlalchemy import text
+
+from app.cache import redis
 from app.config import settings
+from app.models.base import async_session, engine
 from app.routers import articles, sources, auth
 
 
+async def _warm_connection():
+    async with async_session() as session:
+        await session.execute(text("SELECT 1"))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     print(f"🚀 Starting {settings.APP_NAME} API v{settings.VERSION}")
+    # Open DB_POOL_MIN connections concurrently so the first requests
+    # don't pay TCP+TLS setup and start with a primed statement cache
+    await asyncio.gather(*(_warm_connection() for _ in range(settings.DB_POOL_MIN)))
     yield
     # Shutdown
+    await redis.aclose()
+    await engine.dispose()
     print("👋 Shutting down...")
 
 
@@ -24,8 +45,17 @@ app = FastAPI(
     version=settings.VERSION,
     description="API для автоматизированного сбора и публикации новостей ядерной медицины",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+# Compression - article content is Markdown-heavy JSON where brotli/gzip
+# cut payloads ~70%; small responses under 1KB aren't worth the CPU.
+# BrotliMiddleware falls back to gzip for clients without br support.
+if BrotliMiddleware is not None:
+    app.add_middleware(BrotliMiddleware, quality=4, minimum_size=1024, gzip_fallback=True)
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # CORS
 app.add_middleware(
     CORSMiddleware,
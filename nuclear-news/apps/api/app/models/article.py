@@ -1,9 +1,8 @@
 """
 Article models - Raw and Processed
 """
-from datetime import datetime
 from uuid import uuid4
-from sqlalchemy import Column, String, Text, DateTime, Integer, ForeignKey, Boolean, ARRAY, Numeric
+from sqlalchemy import Column, String, Text, DateTime, Integer, ForeignKey, Boolean, ARRAY, Numeric, Index, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from pgvector.sqlalchemy import Vector
@@ -24,10 +23,15 @@ class Source(Base):
     is_active = Column(Boolean, default=True)
     scrape_interval_minutes = Column(Integer, default=60)
     last_scraped_at = Column(DateTime)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    
+    created_at = Column(DateTime, server_default=func.now())
+
     raw_articles = relationship("RawArticle", back_populates="source")
 
+    __table_args__ = (
+        # The scheduler only ever scans active sources
+        Index("idx_sources_active", name, postgresql_where=is_active.is_(True)),
+    )
+
 
 class RawArticle(Base):
     """Raw scraped article before AI processing"""
@@ -40,17 +44,38 @@ class RawArticle(Base):
     title_original = Column(Text, nullable=False)
     content_original = Column(Text)
     published_at = Column(DateTime)
-    scraped_at = Column(DateTime, default=datetime.utcnow)
+    scraped_at = Column(DateTime, server_default=func.now())
     processing_status = Column(String(50), default="pending")
     # pending | processing | processed | failed | duplicate
     embedding = Column(Vector(1536))  # text-embedding-3-small dimension
-    extra_metadata = Column("metadata", JSONB, default={})
+    # Python attribute is extra_metadata ("metadata" shadows Base.metadata);
+    # default=dict, not {}, so rows don't share one mutable instance
+    extra_metadata = Column("metadata", JSONB, default=dict)
     
     source = relationship("Source", back_populates="raw_articles")
     
     __table_args__ = (
-        # Unique constraint on source + external_id
-        {"schema": None},
+        # HNSW index for cosine similarity search on embeddings (dedup).
+        # m=24 / ef_construction=128 trade longer builds for better recall;
+        # ef_search is set per connection in app.models.base.
+        Index(
+            "idx_raw_articles_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 24, "ef_construction": 128},
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+        ),
+        # JSONB containment queries on scraper metadata
+        Index("idx_raw_articles_meta_gin", "metadata", postgresql_using="gin"),
+        # Processing queue scan - only unprocessed rows, so the index
+        # stays tiny and hot in cache
+        Index(
+            "idx_raw_pending",
+            scraped_at,
+            postgresql_where=processing_status.in_(("pending", "processing")),
+        ),
+        # Dedup anchor for ON CONFLICT DO NOTHING ingestion
+        UniqueConstraint("source_id", "external_id", name="uq_raw_source_ext"),
     )
 
 
@@ -88,7 +113,38 @@ class Article(Base):
     processing_cost_usd = Column(Numeric(10, 6))
     
     # Audit
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     created_by = Column(UUID(as_uuid=True))
     published_by = Column(UUID(as_uuid=True))
+
+    __table_args__ = (
+        # Serves both the filtered count and the ordered page fetch in
+        # the list endpoint
+        Index(
+            "idx_articles_status_category_created",
+            status,
+            category,
+            created_at.desc(),
+        ),
+        # Keyset pagination on (created_at, id)
+        Index(
+            "idx_articles_created_id",
+            created_at.desc(),
+            id.desc(),
+        ),
+        # Partial indexes for the two hot status subsets; INCLUDE covers
+        # the list-view columns for index-only scans
+        Index(
+            "idx_articles_draft",
+            created_at.desc(),
+            postgresql_where=(status == "draft"),
+            postgresql_include=["slug", "title", "category"],
+        ),
+        Index(
+            "idx_articles_published",
+            published_at.desc(),
+            postgresql_where=(status == "published"),
+            postgresql_include=["slug", "title", "category"],
+        ),
+    )
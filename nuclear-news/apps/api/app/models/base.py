@@ -3,6 +3,7 @@ SQLAlchemy base and database connection
 """
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import NullPool
 from pgvector.sqlalchemy import Vector
 
 from app.config import settings
@@ -12,10 +13,37 @@ class Base(DeclarativeBase):
     pass
 
 
+_connect_args = {
+    # Widen the HNSW candidate list (default 40) for similarity queries.
+    # Applied once per connection instead of SET LOCAL per query.
+    "server_settings": {"hnsw.ef_search": str(settings.HNSW_EF_SEARCH)},
+    # Cache prepared statements so repeated query shapes (SELECT by id,
+    # status filters) skip the parse+bind round-trip after first use.
+    "statement_cache_size": 256,
+    "prepared_statement_cache_size": 256,
+}
+
+if settings.USE_PGBOUNCER:
+    # PgBouncer in transaction mode multiplexes connections itself;
+    # double-pooling just wastes server slots, and prepared statements
+    # collide across multiplexed connections.
+    _pool_kwargs = {"poolclass": NullPool}
+    _connect_args["statement_cache_size"] = 0
+    _connect_args["prepared_statement_cache_size"] = 0
+else:
+    _pool_kwargs = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": 1800,
+    }
+
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     pool_pre_ping=True,
+    connect_args=_connect_args,
+    **_pool_kwargs,
 )
 
 async_session = async_sessionmaker(
@@ -26,6 +54,7 @@ async_session = async_sessionmaker(
 
 
 async def get_db() -> AsyncSession:
+    """Request-scoped session for endpoints that write - commits on success."""
     async with async_session() as session:
         try:
             yield session
@@ -35,3 +64,15 @@ async def get_db() -> AsyncSession:
             raise
         finally:
             await session.close()
+
+
+async def get_db_readonly() -> AsyncSession:
+    """Session for pure reads - no COMMIT, so GETs skip the WAL flush."""
+    async with async_session() as session:
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
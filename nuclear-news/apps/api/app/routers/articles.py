@@ -1,61 +1,155 @@
 """
 Articles API endpoints
 """
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, text, tuple_, update
 from typing import Optional
 
-from app.models.base import get_db
+from app.cache import cache_get, cache_set
+from app.models.base import async_session, get_db, get_db_readonly
 from app.models.article import Article
 from app.schemas.article import ArticleResponse, ArticleUpdate, ArticleList
 
 router = APIRouter(prefix="/articles", tags=["articles"])
 
+# First page of the published feed is the public homepage; a short TTL
+# bounds staleness without needing invalidation on publish
+_PUBLISHED_CACHE_TTL = 30
+
+
+def _encode_cursor(article: Article) -> str:
+    """Opaque keyset cursor: base64 of "created_at_iso|id"."""
+    raw = f"{article.created_at.isoformat()}|{article.id}"
+    return urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        raw = urlsafe_b64decode(cursor.encode()).decode()
+        created_at, _, article_id = raw.partition("|")
+        return datetime.fromisoformat(created_at), UUID(article_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 
 @router.get("/", response_model=ArticleList)
 async def list_articles(
     status: Optional[str] = Query(None, description="Filter by status"),
     category: Optional[str] = Query(None),
-    skip: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the previous page"),
     limit: int = Query(20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_readonly),
 ):
-    """List articles with optional filters"""
-    query = select(Article).order_by(Article.created_at.desc())
-    
+    """List articles with optional filters (keyset pagination)"""
+    cache_key = None
+    if cursor is None and status == "published":
+        cache_key = f"articles:published:{category}:{limit}"
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+
+    filters = []
     if status:
-        query = query.where(Article.status == status)
+        filters.append(Article.status == status)
     if category:
-        query = query.where(Article.category == category)
-    
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = await db.scalar(count_query)
-    
-    # Paginate
-    query = query.offset(skip).limit(limit)
-    result = await db.execute(query)
+        filters.append(Article.category == category)
+
+    # Keyset on (created_at, id) - O(limit) regardless of page depth,
+    # unlike OFFSET which scans and discards all preceding rows
+    query = select(Article).where(*filters)
+    if cursor:
+        cursor_ts, cursor_id = _decode_cursor(cursor)
+        query = query.where(
+            tuple_(Article.created_at, Article.id) < (cursor_ts, cursor_id)
+        )
+
+    result = await db.execute(
+        query.order_by(Article.created_at.desc(), Article.id.desc()).limit(limit)
+    )
     articles = result.scalars().all()
-    
-    return ArticleList(items=articles, total=total, skip=skip, limit=limit)
+
+    # Count only on the first page; unfiltered, a planner estimate is enough
+    total = None
+    if cursor is None:
+        if filters:
+            total = await db.scalar(select(func.count(Article.id)).where(*filters))
+        else:
+            estimate = await db.scalar(
+                text("SELECT reltuples::bigint FROM pg_class WHERE relname = 'articles'")
+            )
+            total = max(int(estimate or 0), 0)
+
+    next_cursor = _encode_cursor(articles[-1]) if len(articles) == limit else None
+
+    # Validate once and serialize in Rust; returning a Response skips
+    # FastAPI's second response_model validation pass over every row
+    payload = ArticleList(
+        items=articles, total=total, limit=limit, next_cursor=next_cursor
+    ).model_dump_json()
+
+    if cache_key is not None:
+        await cache_set(cache_key, payload, _PUBLISHED_CACHE_TTL)
+
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/drafts", response_model=ArticleList)
 async def get_drafts(
-    skip: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
     limit: int = Query(20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_readonly),
 ):
     """Get draft articles for moderation"""
-    return await list_articles(status="draft", skip=skip, limit=limit, db=db)
+    # category=None explicitly: calling the endpoint function directly
+    # would otherwise leave the Query(...) FieldInfo default in place,
+    # which is truthy and becomes a bogus filter
+    return await list_articles(
+        status="draft", category=None, cursor=cursor, limit=limit, db=db
+    )
+
+
+@router.get("/export")
+async def export_articles(
+    status: Optional[str] = Query(None, description="Filter by status"),
+    category: Optional[str] = Query(None),
+):
+    """Stream all matching articles as NDJSON (admin/export)"""
+    filters = []
+    if status:
+        filters.append(Article.status == status)
+    if category:
+        filters.append(Article.category == category)
+
+    async def generate():
+        # The session is opened here, not via Depends - dependency
+        # teardown runs before StreamingResponse consumes the generator,
+        # which would leak the connection the stream checks out
+        async with async_session() as session:
+            # Server-side cursor + yield_per keeps memory at O(chunk)
+            # instead of materializing every row before the first byte
+            # goes out
+            result = await session.stream(
+                select(Article)
+                .where(*filters)
+                .order_by(Article.created_at.desc())
+                .execution_options(yield_per=200)
+            )
+            async for partition in result.scalars().partitions():
+                for article in partition:
+                    yield ArticleResponse.model_validate(article).model_dump_json() + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @router.get("/{article_id}", response_model=ArticleResponse)
 async def get_article(
     article_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_readonly),
 ):
     """Get single article by ID"""
     result = await db.execute(
@@ -76,20 +170,23 @@ async def update_article(
     db: AsyncSession = Depends(get_db),
 ):
     """Update article (edit before publishing)"""
+    values = data.model_dump(exclude_unset=True)
+    if not values:
+        raise HTTPException(status_code=400, detail="No fields to update")
+
+    # Single UPDATE ... RETURNING instead of select + mutate + refresh
     result = await db.execute(
-        select(Article).where(Article.id == article_id)
+        update(Article)
+        .where(Article.id == article_id)
+        .values(**values)
+        .returning(Article)
     )
     article = result.scalar_one_or_none()
-    
+
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
-    
-    for field, value in data.model_dump(exclude_unset=True).items():
-        setattr(article, field, value)
-    
+
     await db.commit()
-    await db.refresh(article)
-    
     return article
 
 
@@ -100,29 +197,30 @@ async def publish_article(
     # user: User = Depends(get_current_user),  # TODO: Add auth
 ):
     """Publish article - triggers Astro rebuild"""
-    from datetime import datetime
-    
+    # The status guard lives in the WHERE clause, so publish is one
+    # round-trip and race-free under concurrent requests
     result = await db.execute(
-        select(Article).where(Article.id == article_id)
+        update(Article)
+        .where(Article.id == article_id, Article.status != "published")
+        .values(status="published", published_at=func.now())
+        # .values(published_by=user.id)  # TODO: Add auth
+        .returning(Article)
     )
     article = result.scalar_one_or_none()
-    
+
     if not article:
+        exists = await db.scalar(
+            select(func.count(Article.id)).where(Article.id == article_id)
+        )
+        if exists:
+            raise HTTPException(status_code=400, detail="Article already published")
         raise HTTPException(status_code=404, detail="Article not found")
-    
-    if article.status == "published":
-        raise HTTPException(status_code=400, detail="Article already published")
-    
-    article.status = "published"
-    article.published_at = datetime.utcnow()
-    # article.published_by = user.id  # TODO: Add auth
-    
+
     await db.commit()
-    await db.refresh(article)
-    
+
     # TODO: Trigger Astro rebuild webhook
     # await trigger_astro_rebuild(article.slug)
-    
+
     return article
 
 
@@ -133,14 +231,11 @@ async def archive_article(
 ):
     """Archive (unpublish) article"""
     result = await db.execute(
-        select(Article).where(Article.id == article_id)
+        update(Article).where(Article.id == article_id).values(status="archived")
     )
-    article = result.scalar_one_or_none()
-    
-    if not article:
+
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Article not found")
-    
-    article.status = "archived"
+
     await db.commit()
-    
     return {"status": "archived"}
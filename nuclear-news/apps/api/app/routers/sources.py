@@ -2,29 +2,46 @@
 Sources API endpoints - manage news sources
 """
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
-from app.models.base import get_db
+from app.cache import cache_delete, cache_get, cache_set
+from app.models.base import get_db, get_db_readonly
 from app.models.article import Source
 from app.schemas.source import SourceCreate, SourceResponse, SourceUpdate
 
 router = APIRouter(prefix="/sources", tags=["sources"])
 
+_source_list_adapter = TypeAdapter(list[SourceResponse])
+
+# The source list changes minutes apart but is read every scheduler tick
+_SOURCES_CACHE_TTL = 60
+_SOURCES_CACHE_KEYS = ("sources:active=True", "sources:active=False")
+
 
 @router.get("/", response_model=list[SourceResponse])
 async def list_sources(
     active_only: bool = True,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_readonly),
 ):
     """List all news sources"""
+    key = f"sources:active={active_only}"
+    cached = await cache_get(key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     query = select(Source).order_by(Source.name)
     if active_only:
         query = query.where(Source.is_active == True)
-    
+
     result = await db.execute(query)
-    return result.scalars().all()
+    sources = _source_list_adapter.validate_python(result.scalars().all())
+    payload = _source_list_adapter.dump_json(sources)
+    await cache_set(key, payload, _SOURCES_CACHE_TTL)
+
+    return Response(content=payload, media_type="application/json")
 
 
 @router.post("/", response_model=SourceResponse)
@@ -37,6 +54,7 @@ async def create_source(
     db.add(source)
     await db.commit()
     await db.refresh(source)
+    await cache_delete(*_SOURCES_CACHE_KEYS)
     return source
 
 
@@ -57,9 +75,10 @@ async def update_source(
     
     for field, value in data.model_dump(exclude_unset=True).items():
         setattr(source, field, value)
-    
+
     await db.commit()
     await db.refresh(source)
+    await cache_delete(*_SOURCES_CACHE_KEYS)
     return source
 
 
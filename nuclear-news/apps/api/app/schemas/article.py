@@ -49,6 +49,6 @@ class ArticleResponse(ArticleBase):
 
 class ArticleList(BaseModel):
     items: list[ArticleResponse]
-    total: int
-    skip: int
+    total: Optional[int] = None  # only populated on the first page
     limit: int
+    next_cursor: Optional[str] = None  # pass back as ?cursor= for the next page
@@ -1,27 +1,64 @@
 """
 AI Article Processor - transforms raw articles into publishable content
 """
-import json
+import asyncio
+import httpx
+import orjson
 from openai import AsyncOpenAI
 from anthropic import AsyncAnthropic
 
 from app.config import settings
 from app.services.ai.prompts import ARTICLE_PROCESSING_PROMPT
 
+# One client per provider for the whole process. Each SDK client owns an
+# httpx connection pool, so constructing them per article paid a fresh
+# TCP+TLS handshake for every LLM call.
+_openai_client = AsyncOpenAI(
+    api_key=settings.OPENAI_API_KEY,
+    max_retries=2,
+    timeout=60.0,
+    http_client=httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+    ),
+)
+_anthropic_client = AsyncAnthropic(
+    api_key=settings.ANTHROPIC_API_KEY,
+    max_retries=2,
+    timeout=60.0,
+    http_client=httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+    ),
+)
+
+# Cap on in-flight LLM calls from process_many
+_MAX_CONCURRENT_REQUESTS = 20
+
+# Pricing as of Dec 2024, precomputed to (input, output) USD per token
+# so cost calculation is two multiplies with no per-call dict building
+_OPENAI_PRICING = {
+    "gpt-4o": (2.50e-6, 10.00e-6),
+    "gpt-4o-mini": (0.15e-6, 0.60e-6),
+    "gpt-4-turbo": (10.00e-6, 30.00e-6),
+}
+_ANTHROPIC_PRICING = {
+    "claude-3-5-sonnet-20241022": (3.00e-6, 15.00e-6),
+    "claude-3-5-haiku-20241022": (0.80e-6, 4.00e-6),
+}
+
 
 class ArticleProcessor:
     """Process raw articles using LLM"""
-    
+
     def __init__(self):
         self.model = settings.AI_MODEL
-        
+
         if "gpt" in self.model or "o1" in self.model:
-            self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+            self.client = _openai_client
             self.provider = "openai"
         else:
-            self.client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+            self.client = _anthropic_client
             self.provider = "anthropic"
-    
+
     async def process(self, raw_article) -> dict:
         """
         Process raw article and return structured content
@@ -29,17 +66,117 @@ class ArticleProcessor:
         Returns:
             dict with keys: title, excerpt, content, category, tags, significance_score
         """
-        prompt = ARTICLE_PROCESSING_PROMPT.format(
-            title=raw_article.title_original,
-            source=raw_article.source.name if raw_article.source else "Unknown",
-            content=raw_article.content_original or raw_article.title_original,
-        )
-        
+        prompt = self._build_prompt(raw_article)
+
         if self.provider == "openai":
             return await self._process_openai(prompt)
         else:
             return await self._process_anthropic(prompt)
-    
+
+    def _build_prompt(self, raw_article) -> str:
+        return ARTICLE_PROCESSING_PROMPT.format(
+            title=raw_article.title_original,
+            source=raw_article.source.name if raw_article.source else "Unknown",
+            content=raw_article.content_original or raw_article.title_original,
+        )
+
+    async def process_many(self, raw_articles: list) -> list[dict]:
+        """
+        Process a batch of raw articles concurrently
+
+        Fans out over the shared keepalive pool, bounded by a semaphore
+        so a large scrape cycle can't stampede the provider.
+        """
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+
+        async def _process_one(raw_article):
+            async with semaphore:
+                return await self.process(raw_article)
+
+        return list(await asyncio.gather(*(_process_one(a) for a in raw_articles)))
+
+    async def process_batch(self, raw_articles: list, poll_interval: float = 30.0) -> list[dict]:
+        """
+        Process a backlog of raw articles via OpenAI's Batch API
+
+        Batch pricing is half the synchronous rate at the cost of
+        asynchronous turnaround (up to 24h) - right for the pending
+        drafts queue, wrong for anything interactive.
+
+        Returns results in input order, in the same shape as process();
+        articles whose batch line failed come back as None.
+        """
+        if self.provider != "openai":
+            raise NotImplementedError("Batch processing requires an OpenAI model")
+
+        lines = [
+            orjson.dumps(
+                {
+                    "custom_id": str(raw_article.id),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.model,
+                        "messages": [
+                            {"role": "user", "content": self._build_prompt(raw_article)}
+                        ],
+                        "response_format": {"type": "json_object"},
+                        "temperature": 0.3,
+                    },
+                }
+            )
+            for raw_article in raw_articles
+        ]
+
+        batch_file = await self.client.files.create(
+            file=("raw_articles.jsonl", b"\n".join(lines)),
+            purpose="batch",
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(poll_interval)
+            batch = await self.client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+        input_rate, output_rate = _OPENAI_PRICING.get(
+            self.model, _OPENAI_PRICING["gpt-4o"]
+        )
+
+        output = await self.client.files.content(batch.output_file_id)
+        results_by_id = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            row = orjson.loads(line)
+            response = row.get("response")
+            if not response or response.get("status_code") != 200:
+                continue
+
+            body = response["body"]
+            result = orjson.loads(body["choices"][0]["message"]["content"])
+            usage = body.get("usage") or {}
+            prompt_tokens = usage.get("prompt_tokens", 0)
+            completion_tokens = usage.get("completion_tokens", 0)
+            result["_usage"] = {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "model": self.model,
+            }
+            # Batch API bills at 50% of the synchronous rate
+            result["_cost_usd"] = 0.5 * (
+                input_rate * prompt_tokens + output_rate * completion_tokens
+            )
+            results_by_id[row["custom_id"]] = result
+
+        return [results_by_id.get(str(raw_article.id)) for raw_article in raw_articles]
+
     async def _process_openai(self, prompt: str) -> dict:
         """Process using OpenAI API"""
         response = await self.client.chat.completions.create(
@@ -49,7 +186,7 @@ class ArticleProcessor:
             temperature=0.3,
         )
         
-        result = json.loads(response.choices[0].message.content)
+        result = orjson.loads(response.choices[0].message.content)
         result["_usage"] = {
             "prompt_tokens": response.usage.prompt_tokens,
             "completion_tokens": response.usage.completion_tokens,
@@ -75,7 +212,7 @@ class ArticleProcessor:
         elif "```" in content:
             content = content.split("```")[1].split("```")[0]
         
-        result = json.loads(content.strip())
+        result = orjson.loads(content.strip())
         result["_usage"] = {
             "input_tokens": response.usage.input_tokens,
             "output_tokens": response.usage.output_tokens,
@@ -87,29 +224,14 @@ class ArticleProcessor:
     
     def _calculate_cost_openai(self, usage) -> float:
         """Calculate cost for OpenAI API call"""
-        # Pricing as of Dec 2024 (per 1M tokens)
-        pricing = {
-            "gpt-4o": {"input": 2.50, "output": 10.00},
-            "gpt-4o-mini": {"input": 0.15, "output": 0.60},
-            "gpt-4-turbo": {"input": 10.00, "output": 30.00},
-        }
-        
-        rates = pricing.get(self.model, pricing["gpt-4o"])
-        input_cost = (usage.prompt_tokens / 1_000_000) * rates["input"]
-        output_cost = (usage.completion_tokens / 1_000_000) * rates["output"]
-        
-        return input_cost + output_cost
-    
+        input_rate, output_rate = _OPENAI_PRICING.get(
+            self.model, _OPENAI_PRICING["gpt-4o"]
+        )
+        return input_rate * usage.prompt_tokens + output_rate * usage.completion_tokens
+
     def _calculate_cost_anthropic(self, usage) -> float:
         """Calculate cost for Anthropic API call"""
-        # Pricing as of Dec 2024 (per 1M tokens)
-        pricing = {
-            "claude-3-5-sonnet-20241022": {"input": 3.00, "output": 15.00},
-            "claude-3-5-haiku-20241022": {"input": 0.80, "output": 4.00},
-        }
-        
-        rates = pricing.get(self.model, pricing["claude-3-5-sonnet-20241022"])
-        input_cost = (usage.input_tokens / 1_000_000) * rates["input"]
-        output_cost = (usage.output_tokens / 1_000_000) * rates["output"]
-        
-        return input_cost + output_cost
+        input_rate, output_rate = _ANTHROPIC_PRICING.get(
+            self.model, _ANTHROPIC_PRICING["claude-3-5-sonnet-20241022"]
+        )
+        return input_rate * usage.input_tokens + output_rate * usage.output_tokens
@@ -0,0 +1,53 @@
+"""
+Embedding-based deduplication against raw_articles
+"""
+from uuid import UUID
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from pgvector.sqlalchemy import Vector
+
+from app.config import settings
+
+# Top-k nearest neighbours via the HNSW index. Deliberately no extra
+# WHERE clauses on other columns ahead of the ORDER BY - pre-filtering
+# pushes Postgres off the index into a sequential scan; apply any
+# metadata filters to the returned candidates instead.
+_SIMILAR_SQL = text(
+    """
+    SELECT id, 1 - (embedding <=> :query_embedding) AS similarity
+    FROM raw_articles
+    WHERE embedding <=> :query_embedding < :max_distance
+    ORDER BY embedding <=> :query_embedding
+    LIMIT :k
+    """
+).bindparams(bindparam("query_embedding", type_=Vector(1536)))
+
+
+async def find_similar(
+    db: AsyncSession, embedding: list[float], k: int = 5
+) -> list[tuple[UUID, float]]:
+    """
+    Find stored articles similar to the given embedding
+
+    Runs entirely in Postgres against the HNSW index, so only the top-k
+    candidates cross the wire instead of every stored vector.
+
+    Returns:
+        Up to k (raw_article_id, cosine_similarity) pairs above
+        SIMILARITY_THRESHOLD, most similar first
+    """
+    result = await db.execute(
+        _SIMILAR_SQL,
+        {
+            "query_embedding": embedding,
+            "max_distance": 1 - settings.SIMILARITY_THRESHOLD,
+            "k": k,
+        },
+    )
+    return [(row.id, row.similarity) for row in result]
+
+
+async def is_duplicate(db: AsyncSession, embedding: list[float]) -> bool:
+    """True if any stored article exceeds the similarity threshold"""
+    return bool(await find_similar(db, embedding, k=1))
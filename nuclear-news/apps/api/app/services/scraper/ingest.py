@@ -0,0 +1,49 @@
+"""
+Batched raw-article ingestion
+"""
+from uuid import UUID, uuid4
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.article import RawArticle
+from app.services.scraper.base import ScrapedArticle
+
+
+async def ingest_scraped(
+    db: AsyncSession, source_id: UUID, scraped: list[ScrapedArticle]
+) -> list[UUID]:
+    """
+    Insert a scrape cycle's articles in one round-trip
+
+    Rows already present on (source_id, external_id) are dropped by the
+    database via ON CONFLICT DO NOTHING, so a 50-article cycle is one
+    statement instead of 50 insert-or-skip round-trips.
+
+    Returns:
+        ids of the rows actually inserted, for queueing AI processing
+    """
+    if not scraped:
+        return []
+
+    rows = [
+        {
+            "id": uuid4(),
+            "source_id": source_id,
+            "external_id": article.external_id,
+            "external_url": article.external_url,
+            "title_original": article.title,
+            "content_original": article.content,
+            "published_at": article.published_at,
+            "extra_metadata": article.metadata or {},
+        }
+        for article in scraped
+    ]
+
+    result = await db.execute(
+        insert(RawArticle)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=["source_id", "external_id"])
+        .returning(RawArticle.id)
+    )
+    return list(result.scalars())